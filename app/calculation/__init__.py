@@ -10,11 +10,14 @@
 # similar objects without enforcing specific details on how they should work.
 from abc import ABC, abstractmethod
 
-# Import the Operation class from the app.operation module. 
-# The Operation class is where our basic mathematical functions (e.g., addition, subtraction) are defined.
-# Rather than implementing arithmetic logic within each calculation class, we encapsulate it in a 
-# separate class to promote modularity. This makes it easier to modify or extend these functions independently.
-from app.operation import Operation
+# operator exposes Python's arithmetic operators as plain functions (operator.add(a, b) is a + b).
+# namedtuple builds a small immutable record class, which is much lighter than a full Calculation object.
+import operator
+import sys
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Type
+
 
 # Abstract Base Class: Calculation
 class Calculation(ABC):
@@ -27,6 +30,12 @@ class Calculation(ABC):
     - Ensures each calculation type implements its own logic.
     """
 
+    # __slots__ gives every instance a fixed set of attributes instead of a per-instance __dict__.
+    # Each Calculation only ever holds two numbers, so this makes instances smaller and
+    # makes reading self.a / self.b slightly faster. Subclasses declare empty __slots__ to keep it that way.
+    # _result caches the value returned by execute(), so printing the calculation again is just a lookup.
+    __slots__ = ('a', 'b', '_result')
+
     def __init__(self, a: float, b: float) -> None:
         """
         Initializes a Calculation instance with two operands (numbers involved in the calculation).
@@ -43,6 +52,19 @@ class Calculation(ABC):
         """
         self.a: float = a # stores first operand as floating point number
         self.b: float = b # stores second operand as floating point number
+        self._result: Optional[float] = None # filled in by the first call to execute()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Sets an attribute, forgetting the cached result when an operand changes.
+
+        **Why?**
+        - `execute()` caches its result, so without this, changing `a` or `b` after
+          the first `execute()` would keep returning the result for the old numbers.
+        """
+        object.__setattr__(self, name, value)
+        if name == 'a' or name == 'b':
+            object.__setattr__(self, '_result', None)
 
     @abstractmethod
     def execute(self) -> float:
@@ -74,7 +96,7 @@ class Calculation(ABC):
         **Returns:**
         - `str`: A string describing the calculation and its result.
         """
-        # run the calculation to get the result
+        # run the calculation to get the result (cached after the first call)
         result = self.execute()
 
         # It gets the name of the class the current object belongs to (like "AdditionCalculation"), 
@@ -100,6 +122,31 @@ class Calculation(ABC):
         # this would return the string: "AdditionCalculation(a=5, b=3)"
         return f"{self.__class__.__name__}(a={self.a}, b={self.b})"
     
+# lightweight history record: CalcRecord
+class CalcRecord(namedtuple('CalcRecord', 'op a b result')):
+    """
+    An immutable record of one finished calculation, used for the REPL history.
+
+    Unlike a Calculation object it stores the result it was created with, so
+    displaying it never has to redo the arithmetic.
+
+    **Fields:**
+    - `op (str)`: The operation name (e.g., 'add').
+    - `a (float)`: The first operand.
+    - `b (float)`: The second operand.
+    - `result (float)`: The result of the calculation.
+    """
+
+    __slots__ = () # keeps records as small as a plain tuple
+
+    def __str__(self) -> str:
+        """
+        Formats the record the same way Calculation.__str__ does,
+        e.g. "AddCalculation: 10.0 Add 5.0 = 15.0".
+        """
+        operation_name = self.op.capitalize()
+        return f"{operation_name}Calculation: {self.a} {operation_name} {self.b} = {self.result}"
+
 # factory class: CalculationFactory
 class CalculationFactory:
     """
@@ -118,8 +165,19 @@ class CalculationFactory:
 
     # _calculations is a dictionary that holds a mapping of calculation types
     # like "add" or "subtract" to their respective classes.
-    _calculations = {}
-
+    _calculations: Dict[str, Type[Calculation]] = {}
+
+    # _ops maps the built-in calculation types straight to the function that does the arithmetic.
+    # Calling one of these is a single call into C, with no object creation or method lookup.
+    # The set of built-in types is fixed when the class is defined, so the table is wrapped in a
+    # read-only MappingProxyType; new types are added through register_calculation instead.
+    _ops: Mapping[str, Callable[[float, float], float]] = MappingProxyType({
+        'add': operator.add,
+        'subtract': operator.sub,
+        'multiply': operator.mul,
+        'divide': operator.truediv,
+        'power': operator.pow,
+    })
 
     @classmethod
     def register_calculation(cls, calculation_type: str):
@@ -143,8 +201,10 @@ class CalculationFactory:
         # subclass means the class that the decorator is being applied to.
         # ex: AdditionCalculation is a subclass, "add" is the key (string)
         def decorator(subclass):
-            # converts calculation_type to lowercase to ensure consistency
-            calculation_type_lower = calculation_type.lower()
+            # converts calculation_type to lowercase to ensure consistency.
+            # sys.intern stores one shared copy of the key, so lookups with the same
+            # lowercase string can match by identity before comparing characters.
+            calculation_type_lower = sys.intern(calculation_type.lower())
 
             # checks if the calculation type has already been registered to avoid duplication
             if calculation_type_lower in cls._calculations:
@@ -177,21 +237,66 @@ class CalculationFactory:
           clear error message listing valid options, helping prevent errors and 
           ensuring the user knows the supported types.
         """
-        calculation_type_lower = calculation_type.lower()
-
-        # The dict.get() method tries to retrieve the value (the class) associated with the given key 
-        # (calculation_type_lower).
-          # If the key exists, it returns the associated class (like AddCalculation).
-          # If the key does not exist, it returns None (instead of raising an error like dict[] would).
-        calculation_class = cls._calculations.get(calculation_type_lower)
-        # If the type is unsupported, raise an error with the available types.
-        if not calculation_class:
-            available_types = ', '.join(cls._calculations.keys())
-
-            # this is 've' in the print(ve) line!!
-            raise ValueError(f"Unsupported calculation type: '{calculation_type}'. Available types: {available_types}")
+        # EAFP: most lookups use a known, lowercase type, so we index the dictionary directly
+        # (dict[] raises KeyError for a missing key) and only handle the rare miss in the except block.
+        calculation_class: Optional[Type[Calculation]]
+        try:
+            calculation_class = cls._calculations[calculation_type]
+        except KeyError:
+            # Keys are stored in lowercase, so retry with a lowercase copy of the type.
+            # dict.get() returns None (instead of raising an error) if it is still missing.
+            calculation_class = cls._calculations.get(calculation_type.lower())
+
+            # If the type is unsupported, raise an error with the available types.
+            if calculation_class is None:
+                available_types = ', '.join(cls._calculations.keys())
+
+                # this is 've' in the print(ve) line!!
+                raise ValueError(f"Unsupported calculation type: '{calculation_type}'. Available types: {available_types}") from None
         # Create and return an instance of the requested calculation class with the provided operands.
         return calculation_class(a, b)    
+
+    @classmethod
+    def builtin_operations(cls) -> Mapping[str, Callable[[float, float], float]]:
+        """
+        Returns the read-only table of built-in calculation types and the functions
+        that perform them (e.g. 'add' -> operator.add).
+
+        **Why a Method Instead of Using `_ops` Directly?**
+        - Other modules (like the calculator's batch mode) need the table, and going
+          through a public method keeps `_ops` an internal detail of the factory.
+        """
+        return cls._ops
+
+    @classmethod
+    def execute(cls, calculation_type: str, a: float, b: float) -> float:
+        """
+        Performs a calculation directly and returns its result, without creating
+        a Calculation object.
+
+        **Parameters:**
+        - `calculation_type (str)`: The type of calculation ('add', 'subtract', 'multiply', 'divide', 'power').
+        - `a (float)`: The first operand.
+        - `b (float)`: The second operand.
+
+        **Returns:**
+        - `float`: The result of the calculation.
+
+        **Raises:**
+        - `ValueError`: If the calculation type is not supported.
+        - `ZeroDivisionError`: If dividing by zero.
+
+        **Why Have Both This and `create_calculation`?**
+        - The REPL only needs the number, so looking the function up in `_ops` is the fastest path.
+        - Calculation types registered with the decorator are not in `_ops`, so they fall back
+          to `create_calculation`, which keeps the factory open for extension.
+        """
+        # like create_calculation, only lowercase the type when the exact string is not found
+        operation = cls._ops.get(calculation_type) or cls._ops.get(calculation_type.lower())
+        if operation is None:
+            # not a built-in type: let create_calculation find it or raise the ValueError
+            return cls.create_calculation(calculation_type, a, b).execute()
+        return operation(a, b)
     
 # difference between registering a class and creating a class:
     # register: You store a reference to a class (not an object) somewhere
@@ -225,9 +330,16 @@ class AddCalculation(Calculation):
     - **Clear Responsibility**: Each class has a clear, single purpose, making the code easier to read.
     """
 
+    __slots__ = () # inherit the operand slots without adding a __dict__
+
     def execute(self) -> float:
-        # calls the addition method from the Operation module to perform the addition
-        return Operation.addition(self.a, self.b)
+        if self._result is not None:
+            return self._result # already computed, reuse the stored result
+
+        # the arithmetic is written inline rather than calling Operation.addition,
+        # which saves a function call for an operation this small
+        self._result = self.a + self.b
+        return self._result
     
 @CalculationFactory.register_calculation('subtract')
 class SubtractCalculation(Calculation):
@@ -238,9 +350,14 @@ class SubtractCalculation(Calculation):
     the implementation separate from other operations.
     """
 
+    __slots__ = ()
+
     def execute(self) -> float:
-        # calls the subtraction method from the Operation module
-        return Operation.subtraction(self.a, self.b)
+        if self._result is not None:
+            return self._result
+
+        self._result = self.a - self.b
+        return self._result
     
 @CalculationFactory.register_calculation('multiply')
 class MultiplyCalculation(Calculation):
@@ -251,9 +368,14 @@ class MultiplyCalculation(Calculation):
     concerns, making it easy to adjust the multiplication logic without affecting other calculations.
     """
 
+    __slots__ = ()
+
     def execute(self) -> float:
-        # calls the multiplication method from the Operation module
-        return Operation.multiplication(self.a, self.b)
+        if self._result is not None:
+            return self._result
+
+        self._result = self.a * self.b
+        return self._result
     
 @CalculationFactory.register_calculation('divide')
 class DivideCalculation(Calculation):
@@ -265,13 +387,23 @@ class DivideCalculation(Calculation):
     checks if the second operand is zero before performing the operation.
     """
 
+    __slots__ = ()
+
     def execute(self) -> float:
+        if self._result is not None:
+            return self._result
+
         # before performing division, check if b is zero to avoid ZeroDivisionError
         if self.b == 0:
             raise ZeroDivisionError("Cannot divide by zero.")
+
+        # x / 1 is exactly x for every float, so the division itself can be skipped
+        if self.b == 1:
+            self._result = float(self.a)
+            return self._result
         
-        # calls the division method from Operation module
-        return Operation.division(self.a, self.b)
+        self._result = self.a / self.b
+        return self._result
     
 @CalculationFactory.register_calculation('power')
 class PowerCalculation(Calculation):
@@ -282,6 +414,18 @@ class PowerCalculation(Calculation):
     concerns, making it easy to adjust the multiplication logic without affecting other calculations.
     """
 
+    __slots__ = ()
+
     def execute(self) -> float:
-        # call the power method from the Operation module
-        return Operation.power(self.a, self.b) # pragma: no cover
\ No newline at end of file
+        if self._result is not None:
+            return self._result
+
+        # x ** 1 is exactly x for every number (including inf, nan and -0.0),
+        # so we can skip the comparatively expensive pow() call. Only when it keeps
+        # the result's type, though: 2 ** 1.0 is 2.0, not 2.
+        if self.b == 1 and (type(self.a) is float or type(self.a) is type(self.b)):
+            self._result = self.a
+            return self._result
+
+        self._result = self.a ** self.b
+        return self._result
\ No newline at end of file
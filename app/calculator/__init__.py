@@ -12,10 +12,167 @@ Throughout the code, comments explain where and why these paradigms are used,
 providing a comprehensive learning experience for students.
 """
 
+import math
+import os
+import re
 import sys
-import readline # enables command history and editing features
-from typing import List
-from app.calculation import Calculation, CalculationFactory
+from array import array
+from itertools import chain, repeat
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+from app.calculation import CalcRecord, CalculationFactory
+from app.operation import Operation
+
+# a decimal number such as 10, -2.5, .5 or 1e-3; anything this matches is accepted by float()
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+# matches a whole "<operation> <num1> <num2>" line, e.g. "add 10 5"
+_LINE_RE = re.compile(rf'^\s*([A-Za-z]+)\s+({_NUMBER})\s+({_NUMBER})\s*$')
+
+# operations that have a dedicated whole-array kernel; the rest use map() in _flush_batch
+_BATCH_KERNELS = {
+    'divide': Operation.division_batch,
+    'power': Operation.power_batch,
+}
+
+# the most calculations a session's history keeps; older ones are dropped first
+HISTORY_MAXLEN = 10_000
+
+class History:
+    """
+    Calculation history stored as parallel columns instead of a list of objects.
+
+    Entry i is made of ops[i], a[i], b[i] and r[i]. The numbers are kept in compact
+    array buffers (8 bytes each for the default 'd' typecode, 4 for 'f') rather than
+    one Python object per calculation.
+    Iterating over a History yields CalcRecord objects (or the saved display text,
+    see below), so it can be displayed exactly like a list of records.
+
+    Calculation types registered with the factory can have their own class name and
+    __str__, so their entries also keep the text the calculation formatted itself
+    as; the few entries that have one are stored in a small dict keyed by position.
+
+    The history keeps at most `maxlen` entries. Once it is full it works as a ring
+    buffer: each new calculation overwrites the oldest one in place, so long sessions
+    use a fixed amount of memory and the columns never have to grow again.
+    """
+
+    __slots__ = ('ops', 'a', 'b', 'r', 'maxlen', '_start', '_text')
+
+    def __init__(self, typecode: str = 'd', maxlen: int = HISTORY_MAXLEN) -> None:
+        self.ops: List[str] = [] # operation names
+        self.a: "array[float]" = array(typecode) # first operands
+        self.b: "array[float]" = array(typecode) # second operands
+        self.r: Union["array[float]", List[object]] = array(typecode) # results (a list once a complex result is added)
+        self.maxlen = maxlen # most entries kept before the oldest are overwritten
+        self._start = 0 # index of the oldest entry once the history is full
+        self._text: Dict[int, str] = {} # display text of entries from registered calculation types
+
+    def append(self, op: str, a: float, b: float, result: float, text: Optional[str] = None) -> None:
+        """
+        Adds one calculation to the end of the history.
+
+        `text` is how the entry should be displayed; leave it out to use the
+        standard CalcRecord format.
+        """
+        i = len(self.ops) if len(self.ops) < self.maxlen else self._start
+        if text is not None:
+            self._text[i] = text
+        elif self._text:
+            # a reused ring slot must not keep the text of the entry it replaces
+            self._text.pop(i, None)
+
+        if len(self.ops) < self.maxlen:
+            try:
+                self.r.append(result)
+            except (TypeError, OverflowError):
+                # results that are not real numbers (e.g. a complex power) or ints too large
+                # for a float do not fit in a float array, so the result column switches to
+                # a plain list from here on
+                self.r = list(self.r)
+                self.r.append(result)
+            self.ops.append(op)
+            self.a.append(a)
+            self.b.append(b)
+            return
+
+        # full: overwrite the oldest entry and move the start of the ring past it
+        try:
+            self.r[i] = result
+        except (TypeError, OverflowError):
+            self.r = list(self.r)
+            self.r[i] = result
+        self.ops[i] = op
+        self.a[i] = a
+        self.b[i] = b
+        self._start = (i + 1) % self.maxlen
+
+    def extend(self, op: str, a_values: array, b_values: array, results: array) -> None:
+        """
+        Adds a group of calculations that all use the same operation.
+        """
+        if len(self.ops) + len(a_values) > self.maxlen:
+            # the group does not fit, so add it one entry at a time to wrap around the ring
+            for a, b, result in zip(a_values, b_values, results):
+                self.append(op, a, b, result)
+            return
+
+        self.r.extend(results)
+        self.ops.extend(repeat(op, len(a_values)))
+        self.a.extend(a_values)
+        self.b.extend(b_values)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def __iter__(self) -> Iterator[Union[CalcRecord, str]]:
+        # records are only built here, when the history is actually displayed
+        if self._start == 0 and not self._text:
+            return map(CalcRecord, self.ops, self.a, self.b, self.r)
+
+        # walk the entries by position, oldest first: once the ring has wrapped they
+        # run from _start to the end and then from 0
+        order = chain(range(self._start, len(self.ops)), range(self._start))
+        return (self._text[i] if i in self._text else CalcRecord(self.ops[i], self.a[i], self.b[i], self.r[i])
+                for i in order)
+
+def _specialize(operation: str, func: Callable[[float, float], float]) -> Callable[[float, float, History], str]:
+    """
+    Builds the fused REPL function for one built-in operation.
+
+    The returned function calculates the result, appends it to the history
+    and returns the display string, all in a single call. The operation's display
+    name is worked out once here instead of on every line.
+
+    Parameters:
+        operation (str): The operation name, e.g. 'add'
+        func (Callable[[float, float], float]): The function that performs the arithmetic
+    """
+    name = operation.capitalize()
+
+    # a / 1 and a ** 1 are exactly a for every float (including inf, nan and -0.0),
+    # so for these operations the arithmetic call is skipped when the second number is 1
+    identity_one = operation in ('divide', 'power')
+
+    def run_line(a: float, b: float, history: History) -> str:
+        result = a if identity_one and b == 1 else func(a, b)
+        history.append(operation, a, b, result)
+        return f"{name}Calculation: {a} {name} {b} = {result}"
+
+    return run_line
+
+# array typecodes for the batch operand types that can be chosen with CALC_DTYPE
+_BATCH_TYPECODES = {
+    'float64': 'd',
+    'float32': 'f',
+}
+
+# largest finite float32; anything bigger would be stored as inf in a float32 array
+_FLOAT32_MAX = 3.4028234663852886e38
+
+# one fused function per built-in operation, used by the REPL's hot path
+_SPECIALIZED: Dict[str, Callable[[float, float, History], str]] = {
+    operation: _specialize(operation, func) for operation, func in CalculationFactory.builtin_operations().items()
+}
 
 def display_help() -> None: # returns no value
     """
@@ -39,6 +196,14 @@ Special Commands:
     history   : Show the history of calculations.
     exit      : Exit the calculator.
 
+Batch Mode:
+    When input is piped or redirected from a file, consecutive lines with the
+    same operation are calculated together. Set CALC_DTYPE=float32 to store the
+    numbers as 32-bit floats: this halves memory use but keeps only about 7
+    significant digits (the default, float64, keeps about 15), so results such
+    as 0.1 will show rounding error. float32 also only reaches about ±3.4e38;
+    a number or result outside that range is reported as an error.
+
 Examples:
     add 10 5
     subtract 15.5 3.2
@@ -48,31 +213,36 @@ Examples:
 
     print(help_message)
 
-def display_history(history: List[Calculation]) -> None: # returns no value
+def display_history(history: Iterable[Union[CalcRecord, str]]) -> None: # returns no value
     """
     Displays the history of calculations performed during the session
 
     Parameters:
-        history (List[Calculation]): A list of Calculation objects representing past calculations
+        history (Iterable[Union[CalcRecord, str]]): The History (or any sequence of records) of past calculations
     """
 
     if not history:
         print("No calculations performed yet.")
     else:
-        print("Calculation History:")
-        for idx, calculation in enumerate(history, start=1):
-            print(f"{idx}. {calculation}")
+        # build the whole listing first and print it once, instead of one print() call per entry
+        lines = "\n".join(f"{idx}. {calculation}" for idx, calculation in enumerate(history, start=1))
+        print("Calculation History:\n" + lines)
 
 def calculator() -> None: # returns no value
     """
     Professional REPL calculator that performs addition, subtraction,
-    multiplication, and division using Calculation classes.
+    multiplication, and division using the CalculationFactory.
 
     This function demonstrates both LBYL and EAFP programming paradigms.
     """
 
-    # initialize an empty list to keep track of calculation history
-    history: List[Calculation] = []
+    # readline enables command history and editing features, which only matter when a person
+    # is typing; piped input and tests skip the import and its start-up cost
+    if sys.stdin.isatty():
+        import readline # noqa: F401
+
+    # initialize an empty History to keep track of calculation history
+    history = History()
 
     # welcome message to the user
     print("Welcome to the professional calculator REPL!")
@@ -82,62 +252,86 @@ def calculator() -> None: # returns no value
     while True:
         try:
             # prompt the user to enter an operation and two numbers
-            # returns entered text as string and removes leading and trailing whitespace
-            user_input: str = input(">> ").strip()
-
-            # LBYL: Look before you leap
-            # before attempting to process the input, we check if its empty
-            # this prevents unnecessary processing and potential errors
-            if not user_input:
-                # input is empty, so we skip processing and prompt again
-                continue # pragma: no cover
-
-            # makes user_input all lowercase
-            command = user_input.lower()
-
-            # LBYL is used here to check if the user input matches any special commands
-            if command == "help":
-                display_help()
-                continue
-            elif command == "history":
-                display_history(history)
-                continue
-            elif command == "exit":
-                print("Exiting calculator. Goodbye!\n")
-                sys.exit(0) # exit program gracefully (instead of using 'break')
+            # returns entered text as string
+            user_input: str = input(">> ")
 
-            # EAFP (easier to ask for forgiveness than permission)
-            # instead of checking if the input is correctly formatted (which can be complex),
-            # we attempt to parse it and handle any exceptions that arise
-            try:
-                # attempt to split user input into operation and operands
-                operation, num1_str, num2_str = user_input.split()
+            # a single regex match checks the usual "<operation> <num1> <num2>" line and pulls out
+            # all three parts in one pass, so we skip strip(), lower() and split() for it
+            match = _LINE_RE.match(user_input)
 
-                # convert operand strings into floats
+            if match is not None:
+                # LBYL: the regex only matches well-formed numbers, so we already know
+                # float() will succeed and don't need a try/except around it
+                operation, num1_str, num2_str = match.groups()
                 num1: float = float(num1_str)
                 num2: float = float(num2_str)
-            except ValueError:
-                # ValueError runs if:
-                    # user_input.split() doesn’t return exactly 3 parts
-                    # Either operand string isn't convertible to a float
-                # catches user error and handles exceptions
-                # characteristic of EAFP
-                print("Invalid input. Please follow the format: <operation> <num1> <num2>")
-                print("Type 'help' for more information.\n")
-                continue
-            
-            # attempt to create a Calculation instance using the factory
+            else:
+                # not a plain calculation line: remove leading and trailing whitespace
+                user_input = user_input.strip()
+
+                # LBYL: Look before you leap
+                # before attempting to process the input, we check if its empty
+                # this prevents unnecessary processing and potential errors
+                if not user_input:
+                    # input is empty, so we skip processing and prompt again
+                    continue # pragma: no cover
+
+                # makes user_input all lowercase
+                command = user_input.lower()
+
+                # LBYL is used here to check if the user input matches any special commands
+                if command == "help":
+                    display_help()
+                    continue
+                elif command == "history":
+                    display_history(history)
+                    continue
+                elif command == "exit":
+                    print("Exiting calculator. Goodbye!\n")
+                    sys.exit(0) # exit program gracefully (instead of using 'break')
+
+                # EAFP (easier to ask for forgiveness than permission)
+                # instead of checking if the input is correctly formatted (which can be complex),
+                # we attempt to parse it and handle any exceptions that arise
+                try:
+                    # attempt to split user input into operation and operands
+                    operation, num1_str, num2_str = user_input.split()
+
+                    # convert operand strings into floats
+                    num1 = float(num1_str)
+                    num2 = float(num2_str)
+                except ValueError:
+                    # ValueError runs if:
+                        # user_input.split() doesn’t return exactly 3 parts
+                        # Either operand string isn't convertible to a float
+                    # catches user error and handles exceptions
+                    # characteristic of EAFP
+                    print("Invalid input. Please follow the format: <operation> <num1> <num2>")
+                    print("Type 'help' for more information.\n")
+                    continue
+
+            # built-in operations have a fused function that calculates, records and formats
+            # in one call; anything else (registered or unknown types) goes through the factory
+            run_line = _SPECIALIZED.get(operation) or _SPECIALIZED.get(operation.lower())
+
+            # attempt to perform the calculation
             try:
-                calculation = CalculationFactory.create_calculation(operation, num1, num2)
+                if run_line is not None:
+                    result_str: str = run_line(num1, num2, history)
+                else:
+                    # registered (or unknown) types: create the Calculation object so that its
+                    # own class name and __str__ are used for the result and the history
+                    calculation = CalculationFactory.create_calculation(operation, num1, num2)
+                    result = calculation.execute()
+                    result_str = str(calculation)
+
+                    # keep the calculation and its display text in history
+                    history.append(operation.lower(), num1, num2, result, result_str)
             except ValueError as ve:
                 # handle unsupported operations
                 print(ve)
                 print("Type 'help' to see the list of supported operations.\n")
                 continue # prompt user again
-
-            # attempt to execute the calculation
-            try:
-                result = calculation.execute()
             except ZeroDivisionError:
                 # handle division error by zero specifically
                 print("Cannot divide by zero!")
@@ -149,13 +343,8 @@ def calculator() -> None: # returns no value
                 print("Please try again.\n")
                 continue  # Prompt the user again
         
-            # prepare the result string for display
-            result_str: str = f"{calculation}"
             print(f"Result: {result_str}\n")
 
-            # append the calculation object to history
-            history.append(calculation)
-
         except KeyboardInterrupt:
             # EAFP example for handling unexpected interruption
             # instead of checking if the user pressed Ctrl+C before each input,
@@ -168,6 +357,161 @@ def calculator() -> None: # returns no value
             print("\nEOF detected. Exiting calculator. Goodbye!")
             sys.exit(0)
 
+def _flush_batch(operation: Optional[str], a_values: "array[float]", b_values: "array[float]", history: History) -> None:
+    """
+    Evaluates one group of consecutive lines that share the same operation.
+
+    Parameters:
+        operation (Optional[str]): The operation shared by every line in the group,
+            or None when no group has been started yet
+        a_values (array): The first operand of each line
+        b_values (array): The second operand of each line
+        history (History): The session history that the results are appended to
+    """
+    if operation is None:
+        # no group is being buffered, so there is nothing to evaluate
+        return
+
+    func = CalculationFactory.builtin_operations()[operation]
+
+    try:
+        # fast path: evaluate the whole group in one pass
+        kernel = _BATCH_KERNELS.get(operation)
+        if kernel is not None:
+            results = kernel(a_values, b_values)
+        else:
+            results = array(a_values.typecode, map(func, a_values, b_values))
+        if results.typecode == 'f' and (math.inf in results or -math.inf in results):
+            # possibly a float32 overflow: the line-by-line path below tells it apart
+            # from a result that really is infinite
+            raise OverflowError
+    except (ZeroDivisionError, ValueError, OverflowError):
+        # a line in the group cannot be calculated in one pass (e.g. a zero divisor),
+        # so evaluate the lines one at a time to report the error against that line
+        pass
+    else:
+        # record the group before printing it, so nothing is printed for a group
+        # that did not make it into the history
+        history.extend(operation, a_values, b_values, results)
+        records = map(CalcRecord, repeat(operation), a_values, b_values, results)
+        print("\n".join(f"Result: {record}\n" for record in records))
+        return
+
+    for a, b in zip(a_values, b_values):
+        try:
+            result = func(a, b)
+            if a_values.typecode == 'f' and isinstance(result, float):
+                # round to float32 so the printed result matches the history (and the
+                # fast path); a finite result that rounds to inf is too large for float32
+                rounded = array('f', [result])[0]
+                if math.isinf(rounded) and not math.isinf(result):
+                    raise OverflowError("Result is outside the float32 range (about ±3.4e38).")
+                result = rounded
+        except ZeroDivisionError:
+            print("Cannot divide by zero!")
+            print("Please enter a non-zero divisor.\n")
+            continue
+        except Exception as e:
+            print(f"An error occurred during calculation: {e}")
+            print("Please try again.\n")
+            continue
+
+        print(f"Result: {CalcRecord(operation, a, b, result)}\n")
+        history.append(operation, a, b, result)
+
+def batch_calculator(lines: Iterable[str]) -> None: # returns no value
+    """
+    Non-interactive counterpart of calculator() for piped or redirected input.
+
+    Consecutive lines that use the same operation are buffered and evaluated as
+    one group and appended to the history together. Special commands behave
+    the same as in the REPL.
+
+    Parameters:
+        lines (Iterable[str]): The input lines, one command per line
+    """
+    # CALC_DTYPE=float32 stores operands and results in 32-bit floats: half the memory,
+    # but only about 7 significant digits. Anything else keeps the default float64.
+    typecode = _BATCH_TYPECODES.get(os.environ.get('CALC_DTYPE', 'float64').lower(), 'd')
+    # the largest number that can be stored in the chosen type without becoming inf
+    max_value = _FLOAT32_MAX if typecode == 'f' else math.inf
+
+    history = History(typecode)
+
+    # operands of the group currently being buffered
+    pending_operation: Optional[str] = None
+    a_values: "array[float]" = array(typecode)
+    b_values: "array[float]" = array(typecode)
+
+    # the built-in operations the batch path can evaluate
+    operations = CalculationFactory.builtin_operations()
+
+    for line in lines:
+        # split() + tuple unpacking is the cheapest way to tokenize a line here; it measured
+        # faster than two str.partition() calls and also accepts tabs and repeated spaces
+        parts = line.split()
+
+        # only single-word lines can be special commands, so calculation lines skip lower()
+        if len(parts) == 1:
+            command = parts[0].lower()
+
+            if command in ("help", "history", "exit"):
+                # flush first so special commands see every earlier calculation
+                _flush_batch(pending_operation, a_values, b_values, history)
+                pending_operation, a_values, b_values = None, array(typecode), array(typecode)
+
+                if command == "help":
+                    display_help()
+                elif command == "history":
+                    display_history(history)
+                else:
+                    print("Exiting calculator. Goodbye!\n")
+                    return
+                continue
+        elif not parts:
+            continue
+
+        try:
+            operation, num1_str, num2_str = parts
+            num1 = float(num1_str)
+            num2 = float(num2_str)
+        except ValueError:
+            _flush_batch(pending_operation, a_values, b_values, history)
+            pending_operation, a_values, b_values = None, array(typecode), array(typecode)
+            print("Invalid input. Please follow the format: <operation> <num1> <num2>")
+            print("Type 'help' for more information.\n")
+            continue
+
+        if max_value < abs(num1) < math.inf or max_value < abs(num2) < math.inf:
+            _flush_batch(pending_operation, a_values, b_values, history)
+            pending_operation, a_values, b_values = None, array(typecode), array(typecode)
+            print("An error occurred during calculation: Number is outside the float32 range (about ±3.4e38).")
+            print("Please try again.\n")
+            continue
+
+        # operations are usually typed in lowercase already, so only lowercase on a miss
+        if operation not in operations:
+            operation = operation.lower()
+
+        if operation not in operations:
+            _flush_batch(pending_operation, a_values, b_values, history)
+            pending_operation, a_values, b_values = None, array(typecode), array(typecode)
+            available_types = ', '.join(operations.keys())
+            print(f"Unsupported calculation type: '{operation}'. Available types: {available_types}")
+            print("Type 'help' to see the list of supported operations.\n")
+            continue
+
+        # a new operation closes the current group
+        if operation != pending_operation:
+            _flush_batch(pending_operation, a_values, b_values, history)
+            pending_operation, a_values, b_values = operation, array(typecode), array(typecode)
+
+        a_values.append(num1)
+        b_values.append(num2)
+
+    # evaluate whatever is still buffered when the input runs out
+    _flush_batch(pending_operation, a_values, b_values, history)
+
 # if this script is run directly, start the calculator REPL
 if __name__ == "__main__":
     calculator() # pragma: no cover
@@ -1,3 +1,46 @@
+import math
+import operator
+from array import array
+
+# Numba is optional. When it is installed, the batch kernels below are compiled to machine code
+# the first time they run (and cached on disk); otherwise they run as ordinary Python loops.
+# fastmath is deliberately left off: it lets the compiler assume there is no inf or nan,
+# which would change results that Python's own operators get right.
+# The type: ignore keeps this module type-checking cleanly so it can be compiled with mypyc (see README).
+try:
+    from numba import njit # type: ignore[import-not-found]
+    _jit = njit(cache=True)
+except ImportError:
+    def _jit(func):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        return func
+
+
+@_jit
+def _power_vec(a, b, out):
+    """
+    Element-wise kernel for Operation.power_batch: out[i] = a[i] ** b[i].
+
+    Returns False as soon as an element has no finite real result that ** would give
+    as a float: a negative base with a fractional exponent (Python returns a complex
+    number), zero to a negative power (Python raises ZeroDivisionError) or an overflow
+    (Python raises OverflowError). `out` is left incomplete in that case.
+    """
+    for i in range(len(a)):
+        x = a[i]
+        y = b[i]
+        if x < 0.0 and y % 1.0 != 0.0:
+            return False
+        if x == 0.0 and y < 0.0:
+            return False
+        r = x ** y
+        if math.isinf(r) and not math.isinf(x) and not math.isinf(y):
+            # only reachable when compiled: plain Python raises OverflowError on the line above
+            return False # pragma: no cover
+        out[i] = r
+    return True
+
+
 class Operation:
     """
     The Operation class groups basic arithmetic operations as static methods for modularity and clarity.
@@ -105,6 +148,34 @@ class Operation:
             raise ValueError("Division by zero is not allowed.") # raises an error if division by zero is attempted
         return a / b
 
+    @staticmethod
+    def division_batch(a: array, b: array) -> array:
+        """
+        Divides every number in `a` by the matching number in `b`.
+
+        Parameters:
+        - a (array): Dividends.
+        - b (array): Divisors, one per dividend.
+
+        Returns:
+        - array: A new array of the same type as `a` holding each a[i] / b[i].
+
+        Raises:
+        - ZeroDivisionError: If any divisor is zero.
+
+        Example:
+        >>> Operation.division_batch(array('d', [10.0, 9.0]), array('d', [2.0, 3.0]))
+        array('d', [5.0, 3.0])
+
+        Note:
+        Instead of checking each divisor inside the loop, the whole batch is checked for
+        zeros once up front, and the division loop itself runs without any branches.
+        """
+        if 0.0 in b:
+            # one scan over the divisors for the entire batch
+            raise ZeroDivisionError("Cannot divide by zero.")
+        return array(a.typecode, map(operator.truediv, a, b))
+
     @staticmethod
     def power(a: float, b: float) -> float:
       """
@@ -126,4 +197,39 @@ class Operation:
         without requiring an instance of the class. This reduces overhead and makes 
         the methods easily reusable in other parts of the program.
       """
-      return a ** b  # Raises a to the power of b and returns the result.
\ No newline at end of file
+      return a ** b  # Raises a to the power of b and returns the result.
+
+    @staticmethod
+    def power_batch(a: array, b: array) -> array:
+      """
+      Raises every number in `a` to the power of the matching number in `b`.
+
+      **Parameters:**
+      - `a (array)`: The base numbers.
+      - `b (array)`: The exponents, one per base.
+
+      **Returns:**
+      - `array`: A new array of the same type as `a` holding each `a[i] ** b[i]`.
+
+      **Raises:**
+      - `ValueError`: If any element has no finite real result: a negative base with a
+        fractional exponent, zero to a negative power, or a result too large for a float.
+
+      **Example:**
+      >>> Operation.power_batch(array('d', [2.0, 3.0]), array('d', [3.0, 2.0]))
+      array('d', [8.0, 9.0])
+
+      *Working on a whole array at once lets the compiled kernel run without going back
+      to the Python interpreter for every number.*
+      """
+      out = array(a.typecode, a) # same type and length as a; every element is overwritten
+      try:
+          complete = _power_vec(a, b, out)
+      except OverflowError:
+          # plain Python raises on an overflow where the compiled kernel returns False
+          complete = False
+      if not complete:
+          # the kernel met an element it cannot handle the way ** does, so let the
+          # caller evaluate the numbers one at a time instead
+          raise ValueError("Power has no finite real result for every element.")
+      return out
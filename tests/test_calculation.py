@@ -11,8 +11,8 @@ Tests are organized following the AAA (Arrange, Act, Assert) pattern and adhere
 to PEP8 standards for code style and formatting.
 """
 
+import sys
 import pytest
-from unittest.mock import patch
 from app.operation import Operation
 from app.calculation import (
     CalculationFactory,
@@ -20,7 +20,9 @@ from app.calculation import (
     SubtractCalculation,
     MultiplyCalculation,
     DivideCalculation,
-    Calculation
+    PowerCalculation,
+    Calculation,
+    CalcRecord
 )
 
 
@@ -28,186 +30,153 @@ from app.calculation import (
 # Test Concrete Calculation Classes
 # -----------------------------------------------------------------------------------
 
-@patch.object(Operation, 'addition')
-def test_add_calculation_execute_positive(mock_addition):
+def test_add_calculation_execute_positive():
     """
     Test the execute method of AddCalculation for a positive scenario.
 
-    This test verifies that the AddCalculation class correctly calls the addition
-    method of the Operation class with the provided operands and returns the expected result.
+    This test verifies that the AddCalculation class correctly performs the addition with
+    the provided operands and returns the expected result.
     """
     # Arrange
     a = 10.0  # First operand
     b = 5.0   # Second operand
     expected_result = 15.0  # Expected result of addition
-    mock_addition.return_value = expected_result  # Mock the addition method's return value
     add_calc = AddCalculation(a, b)  # Instantiate AddCalculation with operands
 
     # Act
     result = add_calc.execute()  # Execute the addition calculation
 
     # Assert
-    mock_addition.assert_called_once_with(a, b)  # Ensure addition was called with correct operands
     assert result == expected_result  # Verify the result matches the expected value
 
 
-@patch.object(Operation, 'addition')
-def test_add_calculation_execute_negative(mock_addition):
+def test_add_calculation_execute_negative():
     """
     Test the execute method of AddCalculation for a negative scenario.
 
-    This test ensures that if the Operation.addition method raises an exception,
-    the AddCalculation.execute method propagates it correctly.
+    This test ensures that if the arithmetic fails (here because the first operand
+    is a string), the AddCalculation.execute method propagates the error.
     """
     # Arrange
-    a = 10.0
+    a = '10'  # Invalid operand type
     b = 5.0
-    mock_addition.side_effect = Exception("Addition error")  # Simulate an exception in addition
     add_calc = AddCalculation(a, b)
 
     # Act & Assert
-    with pytest.raises(Exception) as exc_info:
-        add_calc.execute()  # Attempt to execute addition, expecting an exception
-
-    # Verify that the exception message is as expected
-    # matches this above: mock_addition.side_effect = Exception("Addition error")
-    assert str(exc_info.value) == "Addition error"
+    with pytest.raises(TypeError):
+        add_calc.execute()
 
 
-@patch.object(Operation, 'subtraction')
-def test_subtract_calculation_execute_positive(mock_subtraction):
+def test_subtract_calculation_execute_positive():
     """
     Test the execute method of SubtractCalculation for a positive scenario.
 
-    This test verifies that the SubtractCalculation class correctly calls the subtraction
-    method of the Operation class with the provided operands and returns the expected result.
+    This test verifies that the SubtractCalculation class correctly performs the subtraction with
+    the provided operands and returns the expected result.
     """
     # Arrange
     a = 10.0
     b = 5.0
     expected_result = 5.0
-    mock_subtraction.return_value = expected_result
     subtract_calc = SubtractCalculation(a, b)
 
     # Act
     result = subtract_calc.execute()
 
     # Assert
-    mock_subtraction.assert_called_once_with(a, b)
     assert result == expected_result
 
 
-@patch.object(Operation, 'subtraction')
-def test_subtract_calculation_execute_negative(mock_subtraction):
+def test_subtract_calculation_execute_negative():
     """
     Test the execute method of SubtractCalculation for a negative scenario.
 
-    This test ensures that if the Operation.subtraction method raises an exception,
-    the SubtractCalculation.execute method propagates it correctly.
+    This test ensures that if the arithmetic fails (here because the first operand
+    is a string), the SubtractCalculation.execute method propagates the error.
     """
     # Arrange
-    a = 10.0
+    a = '10'  # Invalid operand type
     b = 5.0
-    mock_subtraction.side_effect = Exception("Subtraction error")
     subtract_calc = SubtractCalculation(a, b)
 
     # Act & Assert
-    with pytest.raises(Exception) as exc_info:
+    with pytest.raises(TypeError):
         subtract_calc.execute()
 
-    # Verify that the exception message is as expected
-    assert str(exc_info.value) == "Subtraction error"
 
-
-@patch.object(Operation, 'multiplication')
-def test_multiply_calculation_execute_positive(mock_multiplication):
+def test_multiply_calculation_execute_positive():
     """
     Test the execute method of MultiplyCalculation for a positive scenario.
 
-    This test verifies that the MultiplyCalculation class correctly calls the multiplication
-    method of the Operation class with the provided operands and returns the expected result.
+    This test verifies that the MultiplyCalculation class correctly performs the multiplication with
+    the provided operands and returns the expected result.
     """
     # Arrange
     a = 10.0
     b = 5.0
     expected_result = 50.0
-    mock_multiplication.return_value = expected_result
     multiply_calc = MultiplyCalculation(a, b)
 
     # Act
     result = multiply_calc.execute()
 
     # Assert
-    mock_multiplication.assert_called_once_with(a, b)
     assert result == expected_result
 
 
-@patch.object(Operation, 'multiplication')
-def test_multiply_calculation_execute_negative(mock_multiplication):
+def test_multiply_calculation_execute_negative():
     """
     Test the execute method of MultiplyCalculation for a negative scenario.
 
-    This test ensures that if the Operation.multiplication method raises an exception,
-    the MultiplyCalculation.execute method propagates it correctly.
+    This test ensures that if the arithmetic fails (here because the first operand
+    is a string), the MultiplyCalculation.execute method propagates the error.
     """
     # Arrange
-    a = 10.0
+    a = '10'  # Invalid operand type
     b = 5.0
-    mock_multiplication.side_effect = Exception("Multiplication error")
     multiply_calc = MultiplyCalculation(a, b)
 
     # Act & Assert
-    with pytest.raises(Exception) as exc_info:
+    with pytest.raises(TypeError):
         multiply_calc.execute()
 
-    # Verify that the exception message is as expected
-    assert str(exc_info.value) == "Multiplication error"
 
-
-@patch.object(Operation, 'division')
-def test_divide_calculation_execute_positive(mock_division):
+def test_divide_calculation_execute_positive():
     """
     Test the execute method of DivideCalculation for a positive scenario.
 
-    This test verifies that the DivideCalculation class correctly calls the division
-    method of the Operation class with the provided operands and returns the expected result.
+    This test verifies that the DivideCalculation class correctly performs the division with
+    the provided operands and returns the expected result.
     """
     # Arrange
     a = 10.0
     b = 5.0
     expected_result = 2.0
-    mock_division.return_value = expected_result
     divide_calc = DivideCalculation(a, b)
 
     # Act
     result = divide_calc.execute()
 
     # Assert
-    mock_division.assert_called_once_with(a, b)
     assert result == expected_result
 
 
-@patch.object(Operation, 'division')
-def test_divide_calculation_execute_negative(mock_division):
+def test_divide_calculation_execute_negative():
     """
     Test the execute method of DivideCalculation for a negative scenario.
 
-    This test ensures that if the Operation.division method raises an exception,
-    the DivideCalculation.execute method propagates it correctly.
+    This test ensures that if the arithmetic fails (here because the first operand
+    is a string), the DivideCalculation.execute method propagates the error.
     """
     # Arrange
-    a = 10.0
+    a = '10'  # Invalid operand type
     b = 5.0
-    mock_division.side_effect = Exception("Division error")
     divide_calc = DivideCalculation(a, b)
 
     # Act & Assert
-    with pytest.raises(Exception) as exc_info:
+    with pytest.raises(TypeError):
         divide_calc.execute()
 
-    # Verify that the exception message is as expected
-    assert str(exc_info.value) == "Division error"
-
 
 def test_divide_calculation_execute_division_by_zero():
     """
@@ -333,6 +302,21 @@ def test_factory_create_unsupported_calculation():
     assert f"Unsupported calculation type: '{unsupported_type}'" in str(exc_info.value)
 
 
+@pytest.mark.parametrize("calc_type", ['abs', 'sqrt', 'mod', 'div', 'pow'])
+def test_factory_requires_full_type_name(calc_type):
+    """
+    Test that the factory matches the whole calculation type, not just its first letter.
+
+    Each of these types starts with the same letter as a registered type, so a
+    dispatcher that only looked at the first character would wrongly accept them.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError) as exc_info:
+        CalculationFactory.create_calculation(calc_type, 10.0, 5.0)
+
+    assert f"Unsupported calculation type: '{calc_type}'" in str(exc_info.value)
+
+
 def test_factory_register_calculation_duplicate():
     """
     Test that registering a calculation type that's already registered raises ValueError.
@@ -354,12 +338,106 @@ def test_factory_register_calculation_duplicate():
     assert "Calculation type 'add' is already registered." in str(exc_info.value)
 
 
+def test_factory_lookup_is_case_insensitive():
+    """
+    Test that calculation types are matched regardless of case, both when
+    registering and when creating calculations.
+    """
+    # Arrange
+    @CalculationFactory.register_calculation('Modulus')
+    class ModulusCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a % self.b
+
+    # Act
+    add_calc = CalculationFactory.create_calculation('Add', 10.0, 5.0)
+    modulus_calc = CalculationFactory.create_calculation('modulus', 10.0, 4.0)
+
+    # Assert
+    assert isinstance(add_calc, AddCalculation)
+    assert isinstance(modulus_calc, ModulusCalculation)
+    assert 'modulus' in CalculationFactory._calculations
+
+
+@pytest.mark.parametrize("calc_type, a, b, expected_result", [
+    ('add', 10.0, 5.0, 15.0),
+    ('subtract', 10.0, 5.0, 5.0),
+    ('multiply', 10.0, 5.0, 50.0),
+    ('DIVIDE', 10.0, 5.0, 2.0),
+    ('power', 2.0, 3.0, 8.0),
+])
+def test_factory_execute_builtin_calculation(calc_type, a, b, expected_result):
+    """
+    Test that CalculationFactory.execute returns the result of each built-in calculation type.
+    """
+    # Act
+    result = CalculationFactory.execute(calc_type, a, b)
+
+    # Assert
+    assert result == expected_result
+
+
+def test_factory_builtin_table_is_read_only():
+    """
+    Test that the built-in dispatch table cannot be changed after the class is defined.
+    """
+    # Act & Assert
+    with pytest.raises(TypeError):
+        CalculationFactory._ops['modulus'] = lambda a, b: a % b
+
+    assert set(CalculationFactory._ops) == {'add', 'subtract', 'multiply', 'divide', 'power'}
+    assert CalculationFactory.builtin_operations() is CalculationFactory._ops
+
+
+def test_factory_execute_registered_calculation():
+    """
+    Test that CalculationFactory.execute falls back to registered Calculation subclasses
+    for types that are not in the built-in dispatch table.
+    """
+    # Arrange
+    @CalculationFactory.register_calculation('modulus')
+    class ModulusCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a % self.b
+
+    # Act
+    result = CalculationFactory.execute('modulus', 10.0, 4.0)
+
+    # Assert
+    assert result == 2.0
+
+
+def test_factory_execute_unsupported_calculation():
+    """
+    Test that CalculationFactory.execute raises ValueError for an unsupported calculation type.
+    """
+    # Act & Assert
+    with pytest.raises(ValueError) as exc_info:
+        CalculationFactory.execute('modulus', 10.0, 5.0)
+
+    assert "Unsupported calculation type: 'modulus'" in str(exc_info.value)
+
+
+def test_calc_record_str_representation():
+    """
+    Test that CalcRecord formats itself the same way as the matching Calculation.
+    """
+    # Arrange
+    record = CalcRecord('add', 10.0, 5.0, 15.0)
+
+    # Act
+    record_str = str(record)
+
+    # Assert
+    assert record_str == "AddCalculation: 10.0 Add 5.0 = 15.0"
+    assert record.result == 15.0
+
+
 # -----------------------------------------------------------------------------------
 # Test String Representations
 # -----------------------------------------------------------------------------------
 
-@patch.object(Operation, 'addition', return_value=15.0)
-def test_calculation_str_representation_addition(mock_addition):
+def test_calculation_str_representation_addition():
     """
     Test the __str__ method of AddCalculation.
 
@@ -380,8 +458,7 @@ def test_calculation_str_representation_addition(mock_addition):
     assert calc_str == expected_str
 
 
-@patch.object(Operation, 'subtraction', return_value=5.0)
-def test_calculation_str_representation_subtraction(mock_subtraction):
+def test_calculation_str_representation_subtraction():
     """
     Test the __str__ method of SubtractCalculation.
 
@@ -402,8 +479,7 @@ def test_calculation_str_representation_subtraction(mock_subtraction):
     assert calc_str == expected_str
 
 
-@patch.object(Operation, 'multiplication', return_value=50.0)
-def test_calculation_str_representation_multiplication(mock_multiplication):
+def test_calculation_str_representation_multiplication():
     """
     Test the __str__ method of MultiplyCalculation.
 
@@ -424,8 +500,7 @@ def test_calculation_str_representation_multiplication(mock_multiplication):
     assert calc_str == expected_str
 
 
-@patch.object(Operation, 'division', return_value=2.0)
-def test_calculation_str_representation_division(mock_division):
+def test_calculation_str_representation_division():
     """
     Test the __str__ method of DivideCalculation.
 
@@ -498,12 +573,7 @@ def test_calculation_repr_representation_division():
     ('multiply', 10.0, 5.0, 50.0),
     ('divide', 10.0, 5.0, 2.0),
 ])
-@patch.object(Operation, 'addition')
-@patch.object(Operation, 'subtraction')
-@patch.object(Operation, 'multiplication')
-@patch.object(Operation, 'division')
 def test_calculation_execute_parameterized(
-    mock_division, mock_multiplication, mock_subtraction, mock_addition,
     calc_type, a, b, expected_result
 ):
     """
@@ -512,30 +582,11 @@ def test_calculation_execute_parameterized(
     This test runs multiple scenarios where different calculation types are executed
     with specific operands, verifying that the correct result is returned.
     """
-    # Arrange: Set the appropriate mock based on calculation type
-    if calc_type == 'add':
-        mock_addition.return_value = expected_result
-    elif calc_type == 'subtract':
-        mock_subtraction.return_value = expected_result
-    elif calc_type == 'multiply':
-        mock_multiplication.return_value = expected_result
-    elif calc_type == 'divide':
-        mock_division.return_value = expected_result
-
     # Act: Create calculation instance and execute
     calc = CalculationFactory.create_calculation(calc_type, a, b)
     result = calc.execute()
 
-    # Assert: Verify the correct operation was called and result matches
-    if calc_type == 'add':
-        mock_addition.assert_called_once_with(a, b)
-    elif calc_type == 'subtract':
-        mock_subtraction.assert_called_once_with(a, b)
-    elif calc_type == 'multiply':
-        mock_multiplication.assert_called_once_with(a, b)
-    elif calc_type == 'divide':
-        mock_division.assert_called_once_with(a, b)
-
+    # Assert: Verify the result matches
     assert result == expected_result
 
 
@@ -549,12 +600,7 @@ def test_calculation_execute_parameterized(
     ('multiply', 10.0, 5.0, "MultiplyCalculation: 10.0 Multiply 5.0 = 50.0"),
     ('divide', 10.0, 5.0, "DivideCalculation: 10.0 Divide 5.0 = 2.0"),
 ])
-@patch.object(Operation, 'addition', return_value=15.0)
-@patch.object(Operation, 'subtraction', return_value=5.0)
-@patch.object(Operation, 'multiplication', return_value=50.0)
-@patch.object(Operation, 'division', return_value=2.0)
 def test_calculation_str_parameterized(
-    mock_division, mock_multiplication, mock_subtraction, mock_addition,
     calc_type, a, b, expected_str
 ):
     """
@@ -563,7 +609,7 @@ def test_calculation_str_parameterized(
     This test verifies that the string representation of different Calculation instances
     is formatted correctly, displaying the class name, operation, operands, and result.
     """
-    # Arrange: No additional setup needed as mocks are already set via decorators
+    # Arrange: No additional setup needed
 
     # Act: Create calculation instance and get string representation
     calc = CalculationFactory.create_calculation(calc_type, a, b)
@@ -571,3 +617,125 @@ def test_calculation_str_parameterized(
 
     # Assert: Verify the string representation matches the expected format
     assert calc_str == expected_str
+
+
+# -----------------------------------------------------------------------------------
+# Tests for Memory Layout
+# -----------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("calc_class", [
+    AddCalculation,
+    SubtractCalculation,
+    MultiplyCalculation,
+    DivideCalculation,
+    PowerCalculation,
+])
+def test_calculation_uses_slots(calc_class):
+    """
+    Test that Calculation subclasses store their operands in slots instead of a per-instance __dict__.
+    """
+    # Arrange
+    calc = calc_class(10.0, 5.0)
+
+    class DictCalculation(calc_class):
+        pass  # no __slots__, so instances get a __dict__ again
+
+    dict_calc = DictCalculation(10.0, 5.0)
+
+    # Act
+    slotted_size = sys.getsizeof(calc)
+    dict_size = sys.getsizeof(dict_calc) + sys.getsizeof(dict_calc.__dict__)
+
+    # Assert
+    assert not hasattr(calc, '__dict__')
+    assert slotted_size < dict_size
+    assert (calc.a, calc.b) == (10.0, 5.0)
+
+
+@pytest.mark.parametrize("calc_class, expected_result", [
+    (AddCalculation, 15.0),
+    (SubtractCalculation, 5.0),
+    (MultiplyCalculation, 50.0),
+    (DivideCalculation, 2.0),
+    (PowerCalculation, 100000.0),
+])
+def test_calculation_execute_caches_result(calc_class, expected_result):
+    """
+    Test that a Calculation stores its result on the first call to execute() and
+    reuses it for later calls and for __str__.
+    """
+    # Arrange
+    calc = calc_class(10.0, 5.0)
+    operation_name = calc_class.__name__.replace('Calculation', '')
+
+    # Act
+    first = calc.execute()
+    cached = calc._result
+    second = calc.execute()
+    calc_str = str(calc)
+
+    # Assert
+    assert first == second == cached == expected_result
+    assert calc_str == f"{calc_class.__name__}: 10.0 {operation_name} 5.0 = {expected_result}"
+
+
+def test_calculation_cache_resets_when_operands_change():
+    """
+    Test that changing an operand after execute() makes the next execute()
+    calculate again instead of returning the cached result for the old numbers.
+    """
+    # Arrange
+    calc = AddCalculation(10.0, 5.0)
+    first = calc.execute()
+
+    # Act
+    calc.a = 1.0
+    after_a = calc.execute()
+    calc.b = 2.0
+    after_b = calc.execute()
+
+    # Assert
+    assert first == 15.0
+    assert after_a == 6.0
+    assert after_b == 3.0
+    assert str(calc) == "AddCalculation: 1.0 Add 2.0 = 3.0"
+
+@pytest.mark.parametrize("a, b", [
+    (2.5, 1.0),
+    (-3.0, 1.0),
+    (-0.0, 1.0),
+    (float('inf'), 1.0),
+    (float('nan'), 1.0),
+    (2, 1.0),  # int base, float exponent: the result is a float
+    (2, 1),    # int base, int exponent: the result stays an int
+])
+def test_power_calculation_exponent_one(a, b):
+    """
+    Test that raising any number to the power of one returns the same value and type
+    as Python's own ** operator (including for inf, nan, -0.0 and int bases).
+    """
+    # Arrange
+    calc = PowerCalculation(a, b)
+
+    # Act
+    result = calc.execute()
+
+    # Assert
+    assert repr(result) == repr(a ** b)
+    assert type(result) is type(a ** b)
+
+
+@pytest.mark.parametrize("a", [2.5, -3.0, -0.0, float('inf'), float('nan')])
+def test_divide_calculation_divisor_one(a):
+    """
+    Test that dividing any number by one returns the number unchanged,
+    matching Python's own / operator (including for inf, nan and -0.0).
+    """
+    # Arrange
+    calc = DivideCalculation(a, 1.0)
+
+    # Act
+    result = calc.execute()
+
+    # Assert
+    assert repr(result) == repr(a / 1.0)
@@ -6,10 +6,12 @@ Each test demonstrates good testing practices using the Arrange-Act-Assert (AAA)
 """
 
 import pytest
+from array import array
 from io import StringIO
 
 # Import the functions to be tested
-from app.calculator import display_help, display_history, calculator
+from app.calculation import Calculation, CalculationFactory
+from app.calculator import display_help, display_history, calculator, batch_calculator, History, _SPECIALIZED, _specialize, _BATCH_KERNELS
 
 def test_display_help(capsys):
     """
@@ -46,6 +48,14 @@ Special Commands:
     history   : Show the history of calculations.
     exit      : Exit the calculator.
 
+Batch Mode:
+    When input is piped or redirected from a file, consecutive lines with the
+    same operation are calculated together. Set CALC_DTYPE=float32 to store the
+    numbers as 32-bit floats: this halves memory use but keeps only about 7
+    significant digits (the default, float64, keeps about 15), so results such
+    as 0.1 will show rounding error. float32 also only reaches about ±3.4e38;
+    a number or result outside that range is reported as an error.
+
 Examples:
     add 10 5
     subtract 15.5 3.2
@@ -105,6 +115,90 @@ def test_display_history_with_entries(capsys):
 4. DivideCalculation: 20.0 Divide 4.0 = 5.0"""
     assert captured.out.strip() == expected_output.strip()
 
+def test_history_stores_columns(capsys):
+    """
+    Test that History keeps each field in its own column and yields records when iterated.
+
+    AAA Pattern:
+    - Arrange: Create a History and add single and grouped calculations, including a complex result.
+    - Act: Display the history.
+    - Assert: Verify the columns and the displayed output.
+    """
+    # Arrange
+    history = History()
+    history.append('add', 10.0, 5.0, 15.0)
+    history.extend('multiply', array('d', [2.0, 3.0]), array('d', [4.0, 5.0]), array('d', [8.0, 15.0]))
+    history.append('power', -8.0, 0.5, (-8.0) ** 0.5)
+
+    # Act
+    display_history(history)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert len(history) == 4
+    assert history.ops == ['add', 'multiply', 'multiply', 'power']
+    assert history.a == array('d', [10.0, 2.0, 3.0, -8.0])
+    assert "1. AddCalculation: 10.0 Add 5.0 = 15.0" in captured.out
+    assert "3. MultiplyCalculation: 3.0 Multiply 5.0 = 15.0" in captured.out
+    assert "4. PowerCalculation: -8.0 Power 0.5 = " in captured.out
+
+def test_history_drops_oldest_entries_when_full():
+    """
+    Test that a full History overwrites its oldest entries and still lists entries oldest first.
+
+    AAA Pattern:
+    - Arrange: Create a History that holds three entries.
+    - Act: Add five single calculations, then a group that is larger than the history.
+    - Assert: Verify only the newest entries are kept, in order.
+    """
+    # Arrange
+    history = History(maxlen=3)
+
+    # Act
+    for n in range(1, 6):
+        history.append('add', float(n), 0.0, float(n))
+    after_appends = [record.a for record in history]
+
+    history.append('power', -8.0, 0.5, (-8.0) ** 0.5)
+    history.append('mod', 10.0, 3.0, 1.0, "ModuloCalculation: 10.0 Modulo 3.0 = 1.0")
+    with_text = [str(record) for record in history]
+    history.extend('multiply', array('d', [6.0, 7.0, 8.0, 9.0]), array('d', [1.0] * 4), array('d', [6.0, 7.0, 8.0, 9.0]))
+
+    # Assert
+    assert len(history) == 3
+    assert after_appends == [3.0, 4.0, 5.0]
+    assert with_text[-1] == "ModuloCalculation: 10.0 Modulo 3.0 = 1.0"
+    assert [str(record) for record in history] == [
+        "MultiplyCalculation: 7.0 Multiply 1.0 = 7.0",
+        "MultiplyCalculation: 8.0 Multiply 1.0 = 8.0",
+        "MultiplyCalculation: 9.0 Multiply 1.0 = 9.0",
+    ]
+
+def test_history_keeps_ints_too_large_for_a_float():
+    """
+    Test that History keeps a result that is too large to be stored as a float,
+    both while it is filling up and once it overwrites its oldest entries.
+
+    AAA Pattern:
+    - Arrange: Create a History that holds two entries and a huge int result.
+    - Act: Append the huge result into an empty slot, then into a reused slot.
+    - Assert: Verify both results are kept unchanged.
+    """
+    # Arrange
+    filling = History(maxlen=2)
+    full = History(maxlen=2)
+    full.append('add', 1.0, 1.0, 2.0)
+    full.append('add', 2.0, 2.0, 4.0)
+    huge = 10 ** 400
+
+    # Act
+    filling.append('power', 10.0, 400.0, huge)
+    full.append('power', 10.0, 400.0, huge)
+
+    # Assert
+    assert [record.result for record in filling] == [huge]
+    assert [record.result for record in full] == [4.0, huge]
+
 def test_calculator_exit(monkeypatch, capsys):
     """
     Test the calculator function's ability to handle the 'exit' command.
@@ -409,21 +503,15 @@ def test_calculator_unexpected_exception(monkeypatch, capsys):
     Test the calculator's handling of unexpected exceptions during calculation execution.
 
     AAA Pattern:
-    - Arrange: Mock the execute method to raise an unexpected exception.
+    - Arrange: Mock the fused 'add' function to raise an unexpected exception.
     - Act: Call the calculator function.
     - Assert: Verify that the appropriate error message is displayed.
     """
     # Arrange
-    class MockCalculation:
-        def execute(self):
-            raise Exception("Mock exception during execution")
-        def __str__(self):
-            return "MockCalculation"
+    def mock_run_line(a, b, history):
+        raise Exception("Mock exception during execution")
 
-    def mock_create_calculation(operation, a, b):
-        return MockCalculation()
-
-    monkeypatch.setattr('app.calculation.CalculationFactory.create_calculation', mock_create_calculation)
+    monkeypatch.setitem(_SPECIALIZED, 'add', mock_run_line)
     user_input = 'add 10 5\nexit\n'
     monkeypatch.setattr('sys.stdin', StringIO(user_input))
 
@@ -435,3 +523,357 @@ def test_calculator_unexpected_exception(monkeypatch, capsys):
     captured = capsys.readouterr()
     assert "An error occurred during calculation: Mock exception during execution" in captured.out
     assert "Please try again." in captured.out
+
+@pytest.mark.parametrize("operation", ['divide', 'power'])
+def test_specialized_skips_arithmetic_when_second_number_is_one(operation):
+    """
+    Test that the fused REPL function for divide and power returns the first number
+    without calling the arithmetic function when the second number is 1.
+
+    AAA Pattern:
+    - Arrange: Build the fused function around a function that records its calls.
+    - Act: Run one line with 1 as the second number and one line with 2.
+    - Assert: Verify only the second line called the arithmetic function.
+    """
+    # Arrange
+    calls = []
+
+    def recording_func(a, b):
+        calls.append((a, b))
+        return 0.0
+
+    run_line = _specialize(operation, recording_func)
+    history = History()
+
+    # Act
+    identity_line = run_line(-0.0, 1.0, history)
+    run_line(3.0, 2.0, history)
+
+    # Assert
+    name = operation.capitalize()
+    assert identity_line == f"{name}Calculation: -0.0 {name} 1.0 = -0.0"
+    assert calls == [(3.0, 2.0)]
+    assert list(history.r) == [-0.0, 0.0]
+
+# -----------------------------------------------------------------------------------
+# Batch Calculator Tests
+# -----------------------------------------------------------------------------------
+
+def test_batch_calculator_groups_operations(capsys):
+    """
+    Test that the batch calculator evaluates consecutive lines and records them in order.
+
+    AAA Pattern:
+    - Arrange: Prepare lines with two groups of operations and a history command.
+    - Act: Call the batch_calculator function.
+    - Assert: Verify every result and the history are displayed in input order.
+    """
+    # Arrange
+    lines = ['add 10 5', 'ADD\t1  2', '', 'power 2 3', 'history']
+
+    # Act
+    batch_calculator(lines)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: AddCalculation: 10.0 Add 5.0 = 15.0" in captured.out
+    assert "Result: AddCalculation: 1.0 Add 2.0 = 3.0" in captured.out
+    assert "Result: PowerCalculation: 2.0 Power 3.0 = 8.0" in captured.out
+    assert """Calculation History:
+1. AddCalculation: 10.0 Add 5.0 = 15.0
+2. AddCalculation: 1.0 Add 2.0 = 3.0
+3. PowerCalculation: 2.0 Power 3.0 = 8.0""" in captured.out
+
+def test_batch_calculator_float32(monkeypatch, capsys):
+    """
+    Test that CALC_DTYPE=float32 makes the batch calculator work in 32-bit floats.
+
+    AAA Pattern:
+    - Arrange: Set CALC_DTYPE to float32 and prepare lines whose values are not exact in 32 bits.
+    - Act: Call the batch_calculator function.
+    - Assert: Verify the results show float32 rounding.
+    """
+    # Arrange
+    monkeypatch.setenv('CALC_DTYPE', 'float32')
+    lines = ['add 0.5 0.25', 'multiply 0.1 1', 'divide 1 4', 'history']
+
+    # Act
+    batch_calculator(lines)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: AddCalculation: 0.5 Add 0.25 = 0.75" in captured.out
+    assert "Result: MultiplyCalculation: 0.10000000149011612 Multiply 1.0 = 0.10000000149011612" in captured.out
+    assert "3. DivideCalculation: 1.0 Divide 4.0 = 0.25" in captured.out
+
+def test_batch_calculator_float32_out_of_range(monkeypatch, capsys):
+    """
+    Test that with CALC_DTYPE=float32, numbers and results beyond the float32 range are
+    reported as errors instead of silently becoming inf.
+
+    AAA Pattern:
+    - Arrange: Set CALC_DTYPE to float32 and prepare lines that go beyond about 3.4e38.
+    - Act: Call the batch_calculator function.
+    - Assert: Verify those lines report an error and only the other lines reach the history.
+    """
+    # Arrange
+    monkeypatch.setenv('CALC_DTYPE', 'float32')
+    lines = ['add 1e300 1', 'power 10 50', 'power 2 3', 'add inf 1', 'history']
+
+    # Act
+    batch_calculator(lines)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Number is outside the float32 range (about ±3.4e38)." in captured.out
+    assert "Result is outside the float32 range (about ±3.4e38)." in captured.out
+    assert "Result: PowerCalculation: 2.0 Power 3.0 = 8.0" in captured.out
+    assert "Result: AddCalculation: inf Add 1.0 = inf" in captured.out  # inf typed in stays inf
+    assert """Calculation History:
+1. PowerCalculation: 2.0 Power 3.0 = 8.0
+2. AddCalculation: inf Add 1.0 = inf""" in captured.out
+
+def test_batch_calculator_float32_fallback_matches_history(monkeypatch, capsys):
+    """
+    Test that with CALC_DTYPE=float32, a group that falls back to line-by-line evaluation
+    prints the same float32 result that is stored in the history.
+
+    AAA Pattern:
+    - Arrange: Set CALC_DTYPE to float32 and mix a zero divisor into a divide group.
+    - Act: Call the batch_calculator function.
+    - Assert: Verify the result line and the history show the same float32 value.
+    """
+    # Arrange
+    monkeypatch.setenv('CALC_DTYPE', 'float32')
+    lines = ['divide 1 3', 'divide 1 0', 'history']
+
+    # Act
+    batch_calculator(lines)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: DivideCalculation: 1.0 Divide 3.0 = 0.3333333432674408" in captured.out
+    assert "Cannot divide by zero!" in captured.out
+    assert "1. DivideCalculation: 1.0 Divide 3.0 = 0.3333333432674408" in captured.out
+    assert "0.3333333333333333" not in captured.out
+
+def test_batch_calculator_does_not_hide_unexpected_errors(monkeypatch, capsys):
+    """
+    Test that an unexpected error in a batch kernel is raised instead of being hidden
+    by quietly re-running the group one line at a time.
+
+    AAA Pattern:
+    - Arrange: Replace the divide kernel with one that fails with an unexpected error.
+    - Act: Call the batch_calculator function with a divide group.
+    - Assert: Verify the error is raised and nothing is printed or recorded.
+    """
+    # Arrange
+    def broken_kernel(a_values, b_values):
+        raise RuntimeError("bug in the kernel")
+
+    monkeypatch.setitem(_BATCH_KERNELS, 'divide', broken_kernel)
+    lines = ['divide 20 4', 'divide 9 3']
+
+    # Act / Assert
+    with pytest.raises(RuntimeError, match="bug in the kernel"):
+        batch_calculator(lines)
+
+    captured = capsys.readouterr()
+    assert "Result:" not in captured.out
+
+def test_batch_calculator_division_by_zero(capsys):
+    """
+    Test that a zero divisor inside a group only fails the line that contains it.
+
+    AAA Pattern:
+    - Arrange: Prepare a divide group where the middle line divides by zero.
+    - Act: Call the batch_calculator function.
+    - Assert: Verify the other lines still produce results.
+    """
+    # Arrange
+    lines = ['divide 20 4', 'divide 10 0', 'divide 9 3']
+
+    # Act
+    batch_calculator(lines)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: DivideCalculation: 20.0 Divide 4.0 = 5.0" in captured.out
+    assert "Cannot divide by zero!" in captured.out
+    assert "Result: DivideCalculation: 9.0 Divide 3.0 = 3.0" in captured.out
+
+def test_batch_calculator_invalid_and_unsupported(capsys):
+    """
+    Test the batch calculator's handling of malformed lines and unknown operations.
+
+    AAA Pattern:
+    - Arrange: Prepare invalid, unsupported and complex-valued lines followed by 'help' and 'exit'.
+    - Act: Call the batch_calculator function.
+    - Assert: Verify the error messages and that lines after 'exit' are ignored.
+    """
+    # Arrange
+    lines = ['add 5', 'subtract', 'modulus 2 3', 'power -8 0.5', 'power 10 1000', 'help', 'exit', 'add 1 1']
+
+    # Act
+    batch_calculator(lines)
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Invalid input. Please follow the format: <operation> <num1> <num2>" in captured.out
+    assert "Unsupported calculation type: 'modulus'." in captured.out
+    assert "Result: PowerCalculation: -8.0 Power 0.5 = " in captured.out
+    assert "An error occurred during calculation:" in captured.out
+    assert "Calculator REPL Help" in captured.out
+    assert "Exiting calculator. Goodbye!" in captured.out
+    assert "1.0 Add 1.0" not in captured.out
+
+def test_calculator_whitespace_and_fallback_input(monkeypatch, capsys):
+    """
+    Test that the calculator accepts padded lines and operands the fast parser does not handle.
+
+    AAA Pattern:
+    - Arrange: Prepare input with extra whitespace, an upper-case operation, 'inf' and a malformed number.
+    - Act: Call the calculator function.
+    - Assert: Verify the valid lines are calculated and the malformed one is rejected.
+    """
+    # Arrange
+    user_input = '  ADD   10  5  \nmultiply inf 2\nadd 1e 2\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: AddCalculation: 10.0 Add 5.0 = 15.0" in captured.out
+    assert "Result: MultiplyCalculation: inf Multiply 2.0 = inf" in captured.out
+    assert "Invalid input. Please follow the format: <operation> <num1> <num2>" in captured.out
+
+def test_calculator_registered_operation(monkeypatch, capsys):
+    """
+    Test that the calculator still supports calculation types registered with the factory.
+
+    AAA Pattern:
+    - Arrange: Register a 'modulus' calculation and prepare input that uses it, then 'history'.
+    - Act: Call the calculator function.
+    - Assert: Verify the result is displayed and recorded in history.
+    """
+    # Arrange
+    @CalculationFactory.register_calculation('modulus')
+    class ModulusCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a % self.b
+
+    user_input = 'modulus 10 4\nhistory\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: ModulusCalculation: 10.0 Modulus 4.0 = 2.0" in captured.out
+    assert "1. ModulusCalculation: 10.0 Modulus 4.0 = 2.0" in captured.out
+
+def test_calculator_interactive_terminal(monkeypatch, capsys):
+    """
+    Test that the calculator also runs when stdin is an interactive terminal.
+
+    AAA Pattern:
+    - Arrange: Provide stdin that reports itself as a terminal, followed by 'exit'.
+    - Act: Call the calculator function.
+    - Assert: Verify the calculator exits gracefully.
+    """
+    # Arrange
+    class TerminalInput(StringIO):
+        def isatty(self):
+            return True
+
+    monkeypatch.setattr('sys.stdin', TerminalInput('exit\n'))
+
+    # Act
+    with pytest.raises(SystemExit) as exc_info:
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Exiting calculator. Goodbye!" in captured.out
+    assert exc_info.value.code == 0
+
+def test_calculator_executes_each_line_once(monkeypatch, capsys):
+    """
+    Test that displaying a result and the history does not repeat the calculation.
+
+    AAA Pattern:
+    - Arrange: Register a calculation that counts how often it is executed, then prepare
+      one line that uses it followed by 'history' twice.
+    - Act: Call the calculator function.
+    - Assert: Verify the calculation ran exactly once.
+    """
+    # Arrange
+    calls = []
+
+    @CalculationFactory.register_calculation('count')
+    class CountCalculation(Calculation):
+        # caches its result the same way the built-in calculation classes do
+        def execute(self) -> float:
+            if self._result is None:
+                calls.append((self.a, self.b))
+                self._result = self.a + self.b
+            return self._result
+
+    user_input = 'count 1 2\nhistory\nhistory\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: CountCalculation: 1.0 Count 2.0 = 3.0" in captured.out
+    assert captured.out.count("1. CountCalculation: 1.0 Count 2.0 = 3.0") == 2
+    assert calls == [(1.0, 2.0)]
+
+def test_calculator_registered_operation_uses_class_formatting(monkeypatch, capsys):
+    """
+    Test that a registered calculation is displayed using its own class, even when
+    the class name does not match the registered key or the class overrides __str__.
+
+    AAA Pattern:
+    - Arrange: Register 'mod' as ModuloCalculation and 'avg' as a class with a custom __str__.
+    - Act: Call the calculator function with both operations and 'history'.
+    - Assert: Verify the result lines and the history use the classes' own formatting.
+    """
+    # Arrange
+    @CalculationFactory.register_calculation('mod')
+    class ModuloCalculation(Calculation):
+        def execute(self) -> float:
+            return self.a % self.b
+
+    @CalculationFactory.register_calculation('avg')
+    class AverageCalculation(Calculation):
+        def execute(self) -> float:
+            return (self.a + self.b) / 2
+
+        def __str__(self) -> str:
+            return f"average of {self.a} and {self.b} is {self.execute()}"
+
+    user_input = 'mod 10 3\navg 1 2\nadd 1 1\nhistory\nexit\n'
+    monkeypatch.setattr('sys.stdin', StringIO(user_input))
+
+    # Act
+    with pytest.raises(SystemExit):
+        calculator()
+
+    # Assert
+    captured = capsys.readouterr()
+    assert "Result: ModuloCalculation: 10.0 Modulo 3.0 = 1.0" in captured.out
+    assert "Result: average of 1.0 and 2.0 is 1.5" in captured.out
+    assert """Calculation History:
+1. ModuloCalculation: 10.0 Modulo 3.0 = 1.0
+2. average of 1.0 and 2.0 is 1.5
+3. AddCalculation: 1.0 Add 1.0 = 2.0""" in captured.out
+    assert "ModCalculation" not in captured.out
@@ -11,7 +11,9 @@ Tests are organized following the AAA (Arrange, Act, Assert) pattern and adhere
 to PEP8 standards for code style and formatting.
 """
 
+import sys
 import pytest
+from array import array
 from app.operation import Operation
 
 
@@ -337,6 +339,37 @@ def test_division_with_zero_numerator():
     assert result == expected_result, f"Expected {a} / {b} to be {expected_result}, got {result}"
 
 
+def test_division_batch():
+    """
+    Test the division_batch method with arrays of dividends and divisors.
+
+    This test verifies that each dividend is divided by its matching divisor.
+    """
+    # Arrange
+    a = array('d', [10.0, 9.0, -4.0])
+    b = array('d', [2.0, 3.0, 8.0])
+
+    # Act
+    result = Operation.division_batch(a, b)
+
+    # Assert
+    assert list(result) == [5.0, 3.0, -0.5]
+    assert result.typecode == 'd'
+
+
+def test_division_batch_with_zero_divisor():
+    """
+    Test that division_batch raises ZeroDivisionError if any divisor is zero.
+    """
+    # Arrange
+    a = array('d', [10.0, 9.0])
+    b = array('d', [2.0, -0.0])
+
+    # Act & Assert
+    with pytest.raises(ZeroDivisionError, match="Cannot divide by zero."):
+        Operation.division_batch(a, b)
+
+
 # -----------------------------------------------------------------------------------
 # Test Invalid Input Types (Negative Testing)
 # -----------------------------------------------------------------------------------
@@ -383,3 +416,78 @@ def test_power_positive():
     assert result == expected_result, f"Expected {a} * {b} to be {expected_result}, got {result}"
 
 
+def test_power_batch():
+    """
+    Test the power_batch method with arrays of bases and exponents.
+
+    This test verifies that each base is raised to its matching exponent and that
+    the result keeps the type of the input array.
+    """
+    # Arrange
+    a = array('d', [2.0, 3.0, 4.0])
+    b = array('d', [3.0, 2.0, 0.5])
+
+    # Act
+    result = Operation.power_batch(a, b)
+
+    # Assert
+    assert list(result) == [8.0, 9.0, 2.0]
+    assert result.typecode == 'd'
+    assert list(a) == [2.0, 3.0, 4.0]  # inputs are left untouched
+
+
+@pytest.mark.parametrize("a_value, b_value", [
+    (-8.0, 0.5),   # negative base, fractional exponent: ** gives a complex number
+    (0.0, -1.0),   # zero to a negative power: ** raises ZeroDivisionError
+    (10.0, 400.0), # overflow: ** raises OverflowError
+])
+def test_power_batch_rejects_elements_without_a_float_result(a_value, b_value):
+    """
+    Test that power_batch raises instead of returning a wrong value when an element
+    has no finite real result, so the caller can evaluate the numbers one at a time.
+    """
+    # Arrange
+    a = array('d', [2.0, a_value])
+    b = array('d', [2.0, b_value])
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        Operation.power_batch(a, b)
+
+
+def test_power_batch_with_numba_compiles_without_fastmath(monkeypatch):
+    """
+    Test the Numba branch of the operation module with a stand-in numba package.
+
+    This test verifies that the kernel is compiled without fastmath (which would change
+    inf and nan results) and that power_batch still rejects the domain cases.
+    """
+    # Arrange
+    import importlib
+    import types
+    import app.operation
+
+    njit_options = []
+
+    def fake_njit(**options):
+        njit_options.append(options)
+        return lambda func: func
+
+    fake_numba = types.ModuleType('numba')
+    fake_numba.njit = fake_njit
+    monkeypatch.setitem(sys.modules, 'numba', fake_numba)
+
+    # Act
+    try:
+        module = importlib.reload(app.operation)
+        result = module.Operation.power_batch(array('d', [2.0, -8.0]), array('d', [3.0, 2.0]))
+        with pytest.raises(ValueError):
+            module.Operation.power_batch(array('d', [-8.0]), array('d', [0.5]))
+    finally:
+        # put the real module back for the rest of the test session
+        monkeypatch.delitem(sys.modules, 'numba')
+        importlib.reload(app.operation)
+
+    # Assert
+    assert njit_options == [{'cache': True}]
+    assert list(result) == [8.0, 64.0]